@@ -9,10 +9,12 @@ This example demonstrates:
 5. Integration with LoggerPlusPlus
 """
 
+import operator
 import pathlib
 import sys
+from types import MappingProxyType
 from typing import List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from configplusplus import EnvConfigLoader, YamlConfigLoader, env, safe_load_envs
 from loggerplusplus import loggerplusplus
@@ -81,8 +83,9 @@ class InfraConfig(EnvConfigLoader):
     LOG_FILE = env("LOG_FILE", cast=pathlib.Path, required=False)
 
     # ──── Paths ────
-    DATA_DIR = env("DATA_DIR", cast=pathlib.Path, default=pathlib.Path("./data"))
-    UPLOAD_DIR = env("UPLOAD_DIR", cast=pathlib.Path, default=pathlib.Path("./uploads"))
+    # Defaults go through `cast` as well, so plain strings are enough
+    DATA_DIR = env("DATA_DIR", cast=pathlib.Path, default="./data")
+    UPLOAD_DIR = env("UPLOAD_DIR", cast=pathlib.Path, default="./uploads")
 
     @classmethod
     def validate(cls) -> None:
@@ -104,24 +107,35 @@ class InfraConfig(EnvConfigLoader):
         if not 0 <= cls.OPENAI_TEMPERATURE <= 2:
             raise RuntimeError("OPENAI_TEMPERATURE must be between 0 and 2")
 
-        # Validate directories
-        if not cls.DATA_DIR.exists():
-            cls.DATA_DIR.mkdir(parents=True, exist_ok=True)
+        # Ensure directories exist (exist_ok makes a prior exists() check redundant)
+        cls.DATA_DIR.mkdir(parents=True, exist_ok=True)
+        cls.UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
-        if not cls.UPLOAD_DIR.exists():
-            cls.UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+        # Values are final once validated: build the connection URLs only once
+        cls._database_url = cls._build_database_url()
+        cls._redis_url = cls._build_redis_url()
 
     @classmethod
     def get_database_url(cls) -> str:
-        """Get PostgreSQL connection URL."""
+        """Get PostgreSQL connection URL (cached by validate())."""
+        return cls.__dict__.get("_database_url") or cls._build_database_url()
+
+    @classmethod
+    def get_redis_url(cls) -> str:
+        """Get Redis connection URL (cached by validate())."""
+        return cls.__dict__.get("_redis_url") or cls._build_redis_url()
+
+    @classmethod
+    def _build_database_url(cls) -> str:
+        """Build PostgreSQL connection URL."""
         return (
             f"postgresql://{cls.DATABASE_USER}:{cls.DATABASE_PASSWORD}"
             f"@{cls.DATABASE_HOST}:{cls.DATABASE_PORT}/{cls.DATABASE_NAME}"
         )
 
     @classmethod
-    def get_redis_url(cls) -> str:
-        """Get Redis connection URL."""
+    def _build_redis_url(cls) -> str:
+        """Build Redis connection URL."""
         if cls.REDIS_PASSWORD:
             return f"redis://:{cls.REDIS_PASSWORD}@{cls.REDIS_HOST}:{cls.REDIS_PORT}/{cls.REDIS_DB}"
         return f"redis://{cls.REDIS_HOST}:{cls.REDIS_PORT}/{cls.REDIS_DB}"
@@ -132,7 +146,7 @@ class InfraConfig(EnvConfigLoader):
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterConfig:
     """Configuration for a search filter."""
 
@@ -140,10 +154,10 @@ class FilterConfig:
     type: str
     label: str
     enabled: bool = True
-    values: List[str] = None
+    values: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessorConfig:
     """Configuration for a document processor."""
 
@@ -154,42 +168,56 @@ class ProcessorConfig:
     max_size_mb: int = 50
 
 
+# Shared read-only stand-in for absent YAML sections (no dict built per lookup)
+_EMPTY = MappingProxyType({})
+
+
 class AppConfig(YamlConfigLoader):
     """Application-specific configuration from YAML."""
 
+    # Only these top-level sections are turned into Python objects
+    SECTIONS = ("filters", "processors", "ui", "search")
+
     def __post_init__(self) -> None:
         """Parse YAML configuration."""
+        raw = self._raw_config
 
         # Parse search filters
         self.filters: List[FilterConfig] = [
-            FilterConfig(**f) for f in self._raw_config.get("filters", [])
+            FilterConfig(**f) for f in raw.get("filters") or ()
         ]
 
         # Parse document processors
         self.processors: List[ProcessorConfig] = [
-            ProcessorConfig(**p) for p in self._raw_config.get("processors", [])
+            ProcessorConfig(**p) for p in raw.get("processors") or ()
         ]
 
+        # Enabled subsets are fixed once parsed: compute them a single time
+        self._enabled_filters = [f for f in self.filters if f.enabled]
+        self._enabled_processors_sorted = sorted(
+            (p for p in self.processors if p.enabled),
+            key=operator.attrgetter("priority"),
+        )
+
         # Parse UI settings
-        ui_config = self._raw_config.get("ui", {})
-        self.theme = ui_config.get("theme", "light")
-        self.items_per_page = ui_config.get("items_per_page", 10)
-        self.enable_preview = ui_config.get("enable_preview", True)
+        get = (raw.get("ui") or _EMPTY).get
+        self.theme = get("theme", "light")
+        self.items_per_page = get("items_per_page", 10)
+        self.enable_preview = get("enable_preview", True)
 
         # Parse search settings
-        search_config = self._raw_config.get("search", {})
-        self.max_results = search_config.get("max_results", 100)
-        self.highlight_terms = search_config.get("highlight_terms", True)
-        self.fuzzy_matching = search_config.get("fuzzy_matching", False)
+        get = (raw.get("search") or _EMPTY).get
+        self.max_results = get("max_results", 100)
+        self.highlight_terms = get("highlight_terms", True)
+        self.fuzzy_matching = get("fuzzy_matching", False)
 
     def get_enabled_filters(self) -> List[FilterConfig]:
         """Get list of enabled filters."""
-        return [f for f in self.filters if f.enabled]
+        return self._enabled_filters
 
     def get_enabled_processors(self) -> List[ProcessorConfig]:
         """Get list of enabled processors sorted by priority."""
-        enabled = [p for p in self.processors if p.enabled]
-        return sorted(enabled, key=lambda x: x.priority)
+        return self._enabled_processors_sorted
 
 
 # ============================================================================
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from configplusplus import YamlConfigLoader
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterConfig:
     """Configuration for a single filter."""
 
@@ -18,7 +18,7 @@ class FilterConfig:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class CardFieldConfig:
     """Configuration for a card field."""
 
@@ -2,8 +2,58 @@
 Base classes for configuration management with beautiful display
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Tuple
+from itertools import groupby
+import functools
 import pathlib
+import re
+import weakref
+
+# Keywords that mark a configuration key as sensitive (matched anywhere in the key)
+_SECRET_RE = re.compile(r"SECRET|API_KEY|PASSWORD|TOKEN|CREDENTIAL", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_absolute(path: pathlib.Path) -> str:
+    """Resolve an absolute path for display, memoized per path."""
+    return str(path.resolve())
+
+
+def _display_path(path: pathlib.Path) -> str:
+    """
+    Resolve a path for display.
+
+    Absolute paths are resolved once per process; relative paths depend on
+    the working directory and are resolved on every call (displays holding
+    one are never cached, see _has_relative_path).
+
+    Args:
+        path: Path to display
+
+    Returns:
+        Resolved path as a string
+    """
+    if path.is_absolute():
+        return _resolve_absolute(path)
+    return str(path.resolve())
+
+
+def _has_relative_path(values: Iterable[Any]) -> bool:
+    """Tell whether a display would show a working-directory dependent path."""
+    return any(
+        isinstance(value, pathlib.Path) and not value.is_absolute() for value in values
+    )
+
+
+def _group_prefix(item: Tuple[str, Any]) -> str:
+    """Return the group prefix of a (key, value) pair: QDRANT_URL -> QDRANT."""
+    return item[0].partition("_")[0]
+
+
+def _group_sort_key(item: Tuple[str, Any]) -> Tuple[str, str]:
+    """Sort by prefix first so each group is contiguous, then by key."""
+    key = item[0]
+    return key.partition("_")[0], key
 
 
 class ConfigMeta(type):
@@ -14,18 +64,83 @@ class ConfigMeta(type):
     - to_dict(): Convert config to dictionary
     - Pretty __repr__ with grouped display
     - Secret masking for sensitive values
+
+    Per class, public keys (UPPERCASE, non-underscore, non-callable
+    attributes) are indexed in _PUBLIC_ATTRS with their values in _VALUES,
+    every public UPPERCASE name the class exposes (inherited included) in
+    the _KEYS frozenset, and the rendered __repr__ is cached. All of these
+    are refreshed whenever an attribute is set or deleted on the class.
+    In-place mutation of a value (e.g. appending to a list attribute) is
+    not tracked.
     """
 
+    # Rendered __repr__ per class, weakly keyed so dynamic classes can be freed
+    _repr_cache: "weakref.WeakKeyDictionary[type, str]" = weakref.WeakKeyDictionary()
+
+    def __init__(cls, name: str, bases: tuple, namespace: dict, **kwargs: Any) -> None:
+        """Index the public configuration keys of the new class."""
+        super().__init__(name, bases, namespace, **kwargs)
+        cls._index_attrs()
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        """Set a class attribute and refresh the per-class caches."""
+        super().__setattr__(name, value)
+        cls._attr_changed(name)
+
+    def __delattr__(cls, name: str) -> None:
+        """Delete a class attribute and refresh the per-class caches."""
+        super().__delattr__(name)
+        cls._attr_changed(name)
+
+    def _attr_changed(cls, name: str) -> None:
+        """Drop the cached repr, re-indexing keys if a public key changed."""
+        if name.isupper() and not name.startswith("_"):
+            cls._index_attrs()
+            # Subclasses inherit the key: keep their _KEYS in sync too
+            for subclass in cls.__subclasses__():
+                subclass._attr_changed(name)
+        ConfigMeta._repr_cache.pop(cls, None)
+
+    def _index_attrs(cls) -> None:
+        """Compute the public configuration keys, group widths and key set."""
+        namespace = cls.__dict__
+        public = tuple(
+            sorted(
+                k
+                for k, v in namespace.items()
+                if k.isupper() and not k.startswith("_") and not callable(v)
+            )
+        )
+        # Key -> value snapshot in key order, copied as-is by to_dict()
+        values = {k: namespace[k] for k in public}
+        # Key column width per display group; keys are static, values are not
+        widths: Dict[str, int] = {}
+        for key in public:
+            prefix = key.partition("_")[0]
+            widths[prefix] = max(widths.get(prefix, 0), len(key))
+
+        # Every public UPPERCASE name reachable from the class, inherited included
+        keys = frozenset(
+            k
+            for klass in cls.__mro__
+            for k in vars(klass)
+            if k.isupper() and not k.startswith("_")
+        )
+
+        # Bypass our own __setattr__: this is bookkeeping, not a config change
+        type.__setattr__(cls, "_PUBLIC_ATTRS", public)
+        type.__setattr__(cls, "_VALUES", values)
+        type.__setattr__(cls, "_KEYS", keys)
+        type.__setattr__(cls, "_group_widths", widths)
+
     def to_dict(cls) -> Dict[str, Any]:
         """
         Return all UPPERCASE, non-callable attributes as a dict.
 
         Returns:
-            Dictionary containing all configuration values
+            Dictionary containing all configuration values, sorted by key
         """
-        return {
-            k: v for k, v in cls.__dict__.items() if k.isupper() and not callable(v)
-        }
+        return dict(cls._VALUES)
 
     def _mask_if_secret(cls, key: str, value: Any) -> Any:
         """
@@ -41,10 +156,7 @@ class ConfigMeta(type):
         if value is None:
             return None
 
-        key_upper = key.upper()
-        sensitive_keywords = ("SECRET", "API_KEY", "PASSWORD", "TOKEN", "CREDENTIAL")
-
-        if any(keyword in key_upper for keyword in sensitive_keywords):
+        if _SECRET_RE.search(key):
             s = str(value)
             if len(s) <= 6:
                 return "***hidden***"
@@ -60,52 +172,64 @@ class ConfigMeta(type):
             QDRANT_URL and QDRANT_PORT -> grouped under "QDRANT"
 
         Returns:
-            Dictionary mapping prefixes to list of (key, value) tuples
+            Dictionary mapping prefixes to list of (key, value) tuples,
+            with prefixes and keys in sorted order
         """
-        items = cls.to_dict()
-        groups: Dict[str, list] = {}
-
-        for k, v in items.items():
-            prefix = k.split("_", 1)[0]  # e.g., QDRANT_URL -> QDRANT
-            groups.setdefault(prefix, []).append((k, v))
-
-        return groups
+        items = sorted(cls.to_dict().items(), key=_group_sort_key)
+        return {prefix: list(group) for prefix, group in groupby(items, _group_prefix)}
 
     def __repr__(cls) -> str:
         """
         Pretty multi-line representation of the configuration.
 
+        Built once per class, then served from the cache until an attribute
+        of the class changes. Classes holding a relative pathlib.Path are
+        rendered on every call, so the path follows the working directory.
+
         Returns:
             Formatted string with grouped configuration display
         """
-        lines = ["\n"]
-        lines.append("╔════════════════════════════════════════════╗")
-        lines.append(f"║  {cls.__name__.upper().center(40)}  ║")
-        lines.append("╚════════════════════════════════════════════╝")
-
-        groups = cls._grouped_items()
-
-        # Sort groups by name for deterministic output
-        for prefix in sorted(groups.keys()):
-            lines.append("")  # blank line
-            lines.append(f"▶ {prefix}")
-            items = groups[prefix]
-
-            if not items:
-                continue
-
-            max_key_len = max(len(k) for k, _ in items)
+        rendered = ConfigMeta._repr_cache.get(cls)
+        if rendered is None:
+            rendered = cls._build_repr()
+            if not _has_relative_path(cls._VALUES.values()):
+                ConfigMeta._repr_cache[cls] = rendered
+        return rendered
+
+    def _build_repr(cls) -> str:
+        """
+        Render the grouped configuration display.
 
-            for key, value in sorted(items, key=lambda kv: kv[0]):
-                display_value = cls._mask_if_secret(key, value)
+        Returns:
+            Formatted string with grouped configuration display
+        """
+        lines = [
+            "\n",
+            "╔════════════════════════════════════════════╗",
+            f"║  {cls.__name__.upper().center(40)}  ║",
+            "╚════════════════════════════════════════════╝",
+        ]
+        append = lines.append  # bound once for the loops below
+        mask = cls._mask_if_secret
+        widths = cls._group_widths
+
+        # Groups and their items come out sorted for deterministic output
+        for prefix, items in cls._grouped_items().items():
+            append("")  # blank line
+            append(f"▶ {prefix}")
+
+            width = widths[prefix]
+
+            for key, value in items:
+                display_value = mask(key, value)
 
                 # Make paths nicer to read
                 if isinstance(display_value, pathlib.Path):
-                    display_value = str(display_value.resolve())
+                    display_value = _display_path(display_value)
 
-                lines.append(f"    {key.ljust(max_key_len)} = {display_value!r}")
+                append(f"    {key:<{width}} = {display_value!r}")
 
-        lines.append("")  # final blank line
+        append("")  # final blank line
         return "\n".join(lines)
 
 
@@ -56,6 +56,7 @@ class EnvConfigLoader(ConfigBase):
         - "no", "No", "NO"
         - "" (empty string)
 
+        Matching ignores case and surrounding whitespace (" No " is False).
         All other values are considered True.
 
     Secret Masking:
@@ -88,7 +89,8 @@ class EnvConfigLoader(ConfigBase):
             >>> MyConfig.get("MISSING_KEY", default="fallback")
             "fallback"
         """
-        return getattr(cls, key.upper(), default)
+        key = key.upper()
+        return getattr(cls, key) if key in cls._KEYS else default
 
     @classmethod
     def has(cls, key: str) -> bool:
@@ -108,7 +110,7 @@ class EnvConfigLoader(ConfigBase):
             >>> MyConfig.has("MISSING_KEY")
             False
         """
-        return hasattr(cls, key.upper())
+        return key.upper() in cls._KEYS
 
     @classmethod
     def validate(cls) -> None:
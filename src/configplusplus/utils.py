@@ -6,11 +6,33 @@ from typing import Any, TypeVar
 from dotenv import load_dotenv
 from loggerplusplus import loggerplusplus
 from loggerplusplus import formats as lpp_formats
+import functools
+import pathlib
 import sys
 import os
 
 T = TypeVar("T")
 
+# Strings treated as False by env(..., cast=bool), compared stripped and lower-cased
+_FALSY = frozenset({"false", "0", "no", ""})
+
+
+def _cast_bool(value: Any) -> bool:
+    """Cast to bool, treating "false", "0", "no" and "" (any case) as False."""
+    if isinstance(value, str):
+        return value.strip().lower() not in _FALSY
+    return bool(value)
+
+
+# Casters env() uses instead of calling the requested type directly
+_CASTERS = {bool: _cast_bool}
+
+
+@functools.lru_cache(maxsize=1024)
+def _path_cached(raw: str) -> pathlib.Path:
+    """Build a pathlib.Path (immutable, so shareable) from a raw string, memoized."""
+    return pathlib.Path(raw)
+
 
 def safe_load_envs(env_path: str = ".env", verbose: bool = True) -> bool:
     """
@@ -63,7 +85,8 @@ def env(
 
     Args:
         key: Environment variable name
-        default: Default value if not found (default: None)
+        default: Default value if not found (default: None), cast like
+            the environment value
         cast: Type to cast the value to (default: str)
         required: Whether the variable is required (default: True)
 
@@ -73,6 +96,12 @@ def env(
     Raises:
         RuntimeError: If required variable is missing and no default provided
 
+    Note:
+        The environment is read on every call. Only the conversion of a
+        given string to pathlib.Path is memoized (the other casts are
+        cheaper than a cache lookup); use env.cache_clear() to drop those
+        results.
+
     Examples:
         >>> env("DATABASE_PORT", cast=int, default=5432)
         5432
@@ -80,21 +109,29 @@ def env(
         >>> env("DEBUG_MODE", cast=bool, default=False)
         False
 
+        >>> env("DATA_DIR", cast=pathlib.Path, default="./data")
+        PosixPath('data')
+
         >>> env("API_KEY")  # Required by default
         RuntimeError: missing required env var API_KEY
     """
-    val = os.getenv(key, default)
+    val = os.environ.get(key, default)
 
     if val is None:
         if required:
             raise RuntimeError(f"missing required env var {key}")
         return None
 
-    # Special handling for boolean casting from string
-    if cast == bool and isinstance(val, str):
-        return val.strip().lower() not in {"false", "0", "no", ""}
+    # Path construction is slow: re-reading the same string reuses the result
+    if cast is pathlib.Path and isinstance(val, str):
+        return _path_cached(val)
+
+    # Table lookup instead of a per-type branch (e.g. bool parses "false")
+    return _CASTERS.get(cast, cast)(val)
+
 
-    return cast(val)
+# Drop memoized cast results (e.g. between tests): env.cache_clear()
+env.cache_clear = _path_cached.cache_clear  # type: ignore[attr-defined]
 
 
 def env_optional(key: str, *, default: Any = None, cast: type = str) -> Any:
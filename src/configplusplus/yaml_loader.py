@@ -2,10 +2,277 @@
 YAML file based configuration loader
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, IO, Tuple
+import functools
+import json
+import os
 import pathlib
+import pickle
+import tempfile
 import yaml
 from loggerplusplus import loggerplusplus
+from configplusplus.base import _SECRET_RE, _display_path, _has_relative_path
+
+try:
+    # LibYAML-backed loader: parsing happens in C (requires PyYAML built with libyaml)
+    from yaml import CSafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as CSafeLoader
+
+# Resolved once at import time so the parse call does not look it up
+_LOADER = CSafeLoader
+
+# Public loader attributes that are not configuration values (logger is a
+# property, stored as _logger when overridden, so it never shows up here)
+_TO_DICT_EXCLUDE = frozenset({"config_path"})
+
+# Sentinel distinguishing a missing key from a stored None
+_MISS = object()
+
+# Suffix of the pickle sidecar written next to the YAML file when cache=True
+_CACHE_SUFFIX = ".cpp-cache"
+
+
+@functools.lru_cache(maxsize=2048)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dot-notation key into its segments, memoized per key."""
+    return tuple(key.split("."))
+
+
+@functools.lru_cache(maxsize=256)
+def _get_logger(identifier: str) -> Any:
+    """Return the LoggerPlusPlus logger bound to identifier, created once."""
+    return loggerplusplus.bind(identifier=identifier)
+
+
+# Tag of a plain mapping; a root with any other explicit tag is fully loaded
+_MAP_TAG = "tag:yaml.org,2002:map"
+
+
+class _StreamFallback(Exception):
+    """Raised when a document needs the full composer to pick sections."""
+
+
+def _register_anchor(
+    anchors: Dict[str, yaml.Node], event: yaml.NodeEvent, node: yaml.Node
+) -> None:
+    """Record an anchored node, rejecting duplicates like PyYAML's composer."""
+    anchor = event.anchor
+    if anchor is None:
+        return
+    if anchor in anchors:
+        raise yaml.composer.ComposerError(
+            f"found duplicate anchor {anchor!r}; first occurrence",
+            anchors[anchor].start_mark,
+            "second occurrence",
+            event.start_mark,
+        )
+    anchors[anchor] = node
+
+
+def _compose_events(loader: Any, anchors: Dict[str, yaml.Node]) -> yaml.Node:
+    """
+    Compose the next node from the loader's event stream.
+
+    Mirrors PyYAML's composer, so that a single section can be composed
+    from the middle of the stream while the rest of the file is skipped.
+
+    Args:
+        loader: Loader positioned on the first event of a node
+        anchors: Anchors registered so far in the document
+
+    Returns:
+        The composed node
+    """
+    event = loader.get_event()
+
+    if isinstance(event, yaml.AliasEvent):
+        if event.anchor not in anchors:
+            raise yaml.composer.ComposerError(
+                None, None, f"found undefined alias {event.anchor!r}", event.start_mark
+            )
+        return anchors[event.anchor]
+
+    tag = event.tag
+    if isinstance(event, yaml.ScalarEvent):
+        if tag is None or tag == "!":
+            tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+        node = yaml.ScalarNode(
+            tag, event.value, event.start_mark, event.end_mark, style=event.style
+        )
+        _register_anchor(anchors, event, node)
+        return node
+
+    if isinstance(event, yaml.SequenceStartEvent):
+        if tag is None or tag == "!":
+            tag = loader.resolve(yaml.SequenceNode, None, event.implicit)
+        node = yaml.SequenceNode(
+            tag, [], event.start_mark, None, flow_style=event.flow_style
+        )
+        _register_anchor(anchors, event, node)
+        while not loader.check_event(yaml.SequenceEndEvent):
+            node.value.append(_compose_events(loader, anchors))
+    else:
+        if tag is None or tag == "!":
+            tag = loader.resolve(yaml.MappingNode, None, event.implicit)
+        node = yaml.MappingNode(
+            tag, [], event.start_mark, None, flow_style=event.flow_style
+        )
+        _register_anchor(anchors, event, node)
+        while not loader.check_event(yaml.MappingEndEvent):
+            key_node = _compose_events(loader, anchors)
+            node.value.append((key_node, _compose_events(loader, anchors)))
+
+    node.end_mark = loader.get_event().end_mark
+    return node
+
+
+def _skip_events(loader: Any, anchors: Dict[str, yaml.Node]) -> None:
+    """
+    Consume the events of the next node without building anything.
+
+    Raises:
+        _StreamFallback: If the node defines an anchor (it may be aliased
+            from a selected section, so it has to be composed) or uses an
+            undefined alias (the full composer reports the error)
+    """
+    depth = 0
+    while True:
+        event = loader.get_event()
+        if isinstance(event, yaml.CollectionEndEvent):
+            depth -= 1
+        elif isinstance(event, yaml.AliasEvent):
+            if event.anchor not in anchors:
+                raise _StreamFallback
+        else:
+            if event.anchor is not None:
+                raise _StreamFallback
+            if isinstance(event, yaml.CollectionStartEvent):
+                depth += 1
+        if depth == 0:
+            return
+
+
+def _construct(loader: Any, node: yaml.Node) -> Any:
+    """
+    Construct a node the way construct_document does.
+
+    Nested values are filled in by the loader's pending generators rather
+    than built depth-first (deep=True), so recursive aliases such as
+    "a: &r {self: *r}" construct like they do in a full load.
+    """
+    data = loader.construct_object(node)
+    while loader.state_generators:
+        state_generators = loader.state_generators
+        loader.state_generators = []
+        for generator in state_generators:
+            for _ in generator:
+                pass
+    return data
+
+
+def _stream_sections(loader: Any, sections: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Build the selected top-level sections straight from the event stream.
+
+    Unselected sections are skipped event by event, so they are never
+    composed into nodes nor constructed.
+
+    Raises:
+        _StreamFallback: If the document is not a single plain (untagged)
+            mapping with scalar keys, or an unselected section defines an
+            anchor
+    """
+    loader.get_event()  # StreamStart
+    if not loader.check_event(yaml.DocumentStartEvent):
+        raise _StreamFallback
+    loader.get_event()
+    if not loader.check_event(yaml.MappingStartEvent):
+        raise _StreamFallback
+    root = loader.get_event()
+    if root.anchor is not None or root.tag not in (None, "!", _MAP_TAG):
+        raise _StreamFallback
+
+    anchors: Dict[str, yaml.Node] = {}
+    data = {}
+    while not loader.check_event(yaml.MappingEndEvent):
+        event = loader.peek_event()
+        if not isinstance(event, yaml.ScalarEvent) or event.anchor is not None:
+            raise _StreamFallback
+        key_node = _compose_events(loader, anchors)
+        if key_node.tag == "tag:yaml.org,2002:merge":
+            # "<<" merges need the whole root mapping
+            raise _StreamFallback
+        key = _construct(loader, key_node)
+
+        if key in sections:
+            data[key] = _construct(loader, _compose_events(loader, anchors))
+        else:
+            _skip_events(loader, anchors)
+
+    loader.get_event()  # MappingEnd
+    loader.get_event()  # DocumentEnd
+    if not loader.check_event(yaml.StreamEndEvent):
+        raise _StreamFallback
+    return data
+
+
+def _compose_sections(loader: Any, sections: Tuple[str, ...]) -> Any:
+    """
+    Compose the whole document, constructing only the selected top-level keys.
+
+    Returns:
+        Dictionary with the selected sections (or the document itself if
+        its root is not a mapping)
+    """
+    root = loader.get_single_node()
+    if root is None:
+        return None
+    # Non-mapping and explicitly tagged roots are constructed as a whole
+    if not isinstance(root, yaml.MappingNode) or root.tag != _MAP_TAG:
+        return loader.construct_document(root)
+
+    # Resolve "<<" merge keys at the root before picking sections
+    loader.flatten_mapping(root)
+    data = {}
+    for key_node, value_node in root.value:
+        key = _construct(loader, key_node)
+        if key in sections:
+            data[key] = _construct(loader, value_node)
+    return data
+
+
+def _load_sections(stream: IO, sections: Tuple[str, ...]) -> Any:
+    """
+    Parse a YAML document, constructing only the selected top-level keys.
+
+    Plain documents are handled from the event stream, skipping unselected
+    sections without composing them. Documents using root-level anchors,
+    merge keys, a tagged or non-mapping root are re-read and fully composed
+    instead, which gives the exact same result.
+
+    Args:
+        stream: Open YAML file
+        sections: Top-level keys to construct
+
+    Returns:
+        Dictionary with the selected sections (or the document itself if
+        its root is not a mapping)
+    """
+    loader = _LOADER(stream)
+    try:
+        return _stream_sections(loader, sections)
+    except _StreamFallback:
+        pass
+    finally:
+        loader.dispose()
+
+    stream.seek(0)
+    loader = _LOADER(stream)
+    try:
+        return _compose_sections(loader, sections)
+    finally:
+        loader.dispose()
 
 
 class YamlConfigLoader:
@@ -53,26 +320,78 @@ class YamlConfigLoader:
           - name: export
             enabled: false
 
+    Display:
+        print(config) renders the public attributes once and caches the
+        result until an attribute is set or deleted on the instance.
+        In-place mutation of a value (e.g. appending to a list attribute)
+        is not tracked.
+
+    Partial Loading:
+        Set the SECTIONS class attribute to the top-level keys your
+        __post_init__ uses. The other sections are skipped while streaming
+        through the file (only syntax-checked, never built) and are absent
+        from _raw_config:
+
+        class MyYamlConfig(YamlConfigLoader):
+            SECTIONS = ("database", "features")
+
+    JSON Files:
+        A .json file is accepted wherever a YAML file is. Set FAST_JSON =
+        True to decode it with the standard json module, which is much
+        faster than YAML parsing; keep editing the YAML file and export it
+        to JSON at build time when startup time matters. The json module
+        follows JSON number rules, so exponent literals without a dot
+        (1e3) become floats where the YAML 1.1 parser keeps them as
+        strings.
+
+    Parse Cache:
+        Pass cache=True to reuse parsed data while the YAML file's mtime
+        and size are unchanged. Within a process, a file already parsed by
+        the same _load_yaml with the same SECTIONS is not parsed again;
+        each instance still gets its own copy of the data.
+        YamlConfigLoader.clear_cache() forgets these entries.
+
+        Across processes, cache=True also keeps a pickled copy of the
+        parsed data next to the YAML file (config.yaml ->
+        config.yaml.cpp-cache), so repeated startups skip YAML parsing
+        entirely. Only enable it for directories you trust: the sidecar is
+        loaded with pickle.
+
+        Freshness is judged by mtime and size only: a rewrite that keeps
+        both (rsync -t, tar, cp -p, os.utime) is not noticed. Leave cache
+        off, or call clear_cache() and delete the sidecar, in that case.
+
     Attributes:
         config_path: Path to the loaded YAML file
         _raw_config: Raw dictionary loaded from YAML
-        logger: LoggerPlusPlus logger instance
+        logger: LoggerPlusPlus logger (bound once per class name unless
+            assigned on the instance)
     """
 
-    def __init__(self, config_path: str | pathlib.Path) -> None:
+    # Top-level keys to construct from the YAML file (None = whole document)
+    SECTIONS: Tuple[str, ...] | None = None
+
+    # Decode .json files with the json module instead of the YAML parser
+    FAST_JSON: bool = False
+
+    # Process-wide parse cache, used with cache=True:
+    # (resolved path, SECTIONS, FAST_JSON, _load_yaml) -> (stamp, pickled data)
+    _PARSE_CACHE: Dict[Tuple[Any, ...], Tuple[Tuple[int, int], bytes]] = {}
+
+    def __init__(self, config_path: str | pathlib.Path, cache: bool = False) -> None:
         """
         Initialize the YAML config loader.
 
         Args:
             config_path: Path to the YAML configuration file
+            cache: Whether to reuse parsed data while the file's mtime and
+                size are unchanged, in process and through a pickle sidecar
+                (default: False)
 
         Raises:
             FileNotFoundError: If the configuration file doesn't exist
             yaml.YAMLError: If the YAML file is invalid
         """
-        # Setup logger
-        self.logger = loggerplusplus.bind(identifier=self.__class__.__name__)
-
         # Convert to Path object
         self.config_path = pathlib.Path(config_path)
 
@@ -82,17 +401,96 @@ class YamlConfigLoader:
             self.logger.error(msg)
             raise FileNotFoundError(msg)
 
-        # Load the YAML file
-        self._raw_config = self._load_yaml()
+        # Load the YAML file (with cache=True, reusing data while it is unchanged)
+        self._raw_config = self._load_config(cache)
         self.logger.debug(f"Loaded configuration from: {self.config_path}")
 
         # Call the post-init hook for custom parsing
         self.__post_init__()
 
+    @property
+    def logger(self) -> Any:
+        """
+        LoggerPlusPlus logger of the instance.
+
+        Defaults to a logger bound to the class name, shared by its
+        instances; assigning self.logger overrides it for one instance.
+        """
+        logger = self.__dict__.get("_logger")
+        return _get_logger(type(self).__name__) if logger is None else logger
+
+    @logger.setter
+    def logger(self, value: Any) -> None:
+        """Override the logger of this instance."""
+        self._logger = value
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Forget all parsed configuration files and split keys kept by this process.
+
+        Example:
+            >>> YamlConfigLoader.clear_cache()
+        """
+        YamlConfigLoader._PARSE_CACHE.clear()
+        _split_key.cache_clear()
+
+    def _load_config(self, cache: bool) -> Dict[str, Any]:
+        """
+        Load the configuration, with cache=True reusing data parsed earlier.
+
+        Parsed data is kept pickled per (resolved path, SECTIONS, FAST_JSON,
+        _load_yaml implementation) and stamped with the file's (st_mtime_ns, st_size).
+        On a hit every instance gets its own unpickled copy, so mutating
+        _raw_config never leaks into other instances.
+
+        Args:
+            cache: Whether to use the in-process cache and the pickle sidecar
+
+        Returns:
+            Dictionary containing the parsed YAML data
+        """
+        if not cache:
+            return self._load_yaml()
+
+        stat = self.config_path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        # A subclass overriding _load_yaml must never see another class's data
+        key = (
+            self.config_path.resolve(),
+            self._sections_key(),
+            self.FAST_JSON,
+            type(self)._load_yaml,
+        )
+
+        entry = YamlConfigLoader._PARSE_CACHE.get(key)
+        if entry is not None and entry[0] == stamp:
+            return pickle.loads(entry[1])
+
+        data = self._load_cached(stat)
+        try:
+            pickled = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            self.logger.warning(
+                f"Not caching unpicklable config {self.config_path}: {e}"
+            )
+        else:
+            YamlConfigLoader._PARSE_CACHE[key] = (stamp, pickled)
+        return data
+
+    def _sections_key(self) -> Tuple[str, ...] | None:
+        """Return SECTIONS as a hashable tuple (None = whole document)."""
+        sections = self.SECTIONS
+        return None if sections is None else tuple(sections)
+
     def _load_yaml(self) -> Dict[str, Any]:
         """
         Load and parse the YAML configuration file.
 
+        With FAST_JSON, files with a .json suffix are decoded with the json
+        module first (the C JSON decoder is much faster); anything it
+        rejects goes through the YAML parser, which reports the error.
+
         Returns:
             Dictionary containing the parsed YAML data
 
@@ -100,12 +498,85 @@ class YamlConfigLoader:
             yaml.YAMLError: If the YAML file is invalid
         """
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            # Binary mode: the parsers detect the encoding and decode in C
+            with open(self.config_path, "rb") as f:
+                if self.FAST_JSON and self.config_path.suffix.lower() == ".json":
+                    try:
+                        data = json.load(f)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        # Not strict JSON: let the YAML parser report or accept it
+                        f.seek(0)
+                    else:
+                        if self.SECTIONS is not None and isinstance(data, dict):
+                            data = {k: v for k, v in data.items() if k in self.SECTIONS}
+                        return data
+
+                if self.SECTIONS is None:
+                    return yaml.load(f, Loader=_LOADER)
+                return _load_sections(f, self.SECTIONS)
         except yaml.YAMLError as e:
             self.logger.error(f"Failed to parse YAML file: {e}")
             raise
 
+    def _load_cached(self, stat: os.stat_result) -> Dict[str, Any]:
+        """
+        Load the configuration through the pickle sidecar cache.
+
+        The sidecar stores the YAML file's (st_mtime_ns, st_size), the
+        selected SECTIONS, FAST_JSON and the qualified name of the _load_yaml that
+        parsed it, followed by the pickled data. It is used only
+        while that header still matches; otherwise the YAML file is parsed
+        and the sidecar atomically rewritten.
+
+        Args:
+            stat: Result of stat() on the YAML file
+
+        Returns:
+            Dictionary containing the parsed YAML data
+
+        Raises:
+            yaml.YAMLError: If the YAML file is invalid
+        """
+        load_yaml = type(self)._load_yaml
+        header = (
+            stat.st_mtime_ns,
+            stat.st_size,
+            self._sections_key(),
+            self.FAST_JSON,
+            f"{load_yaml.__module__}.{load_yaml.__qualname__}",
+        )
+        cache_path = self.config_path.with_name(self.config_path.name + _CACHE_SUFFIX)
+
+        # Fresh sidecar: skip YAML parsing entirely
+        try:
+            with open(cache_path, "rb") as f:
+                if pickle.load(f) == header:
+                    return pickle.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable config cache {cache_path}: {e}")
+
+        data = self._load_yaml()
+
+        # Write to a temp file then rename, so readers never see a partial cache
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=cache_path.parent, prefix=f".{cache_path.name}."
+            )
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(header, f)
+                pickle.dump(data, f, protocol=5)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            # Unwritable directory or unpicklable data: run without a sidecar
+            self.logger.warning(f"Could not write config cache {cache_path}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+        return data
+
     def __post_init__(self) -> None:
         """
         Hook called after YAML file is loaded.
@@ -140,15 +611,14 @@ class YamlConfigLoader:
             >>> config.get("missing.key", default="fallback")
             "fallback"
         """
-        keys = key.split(".")
         value = self._raw_config
-
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        for k in _split_key(key):
+            if not isinstance(value, dict):
+                return default
+            value = value.get(k, _MISS)
+            if value is _MISS:
+                return default
+        return value
 
     def has(self, key: str) -> bool:
         """
@@ -167,15 +637,7 @@ class YamlConfigLoader:
             >>> config.has("missing.key")
             False
         """
-        keys = key.split(".")
-        value = self._raw_config
-
-        try:
-            for k in keys:
-                value = value[k]
-            return True
-        except (KeyError, TypeError):
-            return False
+        return self.get(key, _MISS) is not _MISS
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -187,7 +649,7 @@ class YamlConfigLoader:
         return {
             k: v
             for k, v in self.__dict__.items()
-            if not k.startswith("_") and k not in ("logger", "config_path")
+            if not k.startswith("_") and k not in _TO_DICT_EXCLUDE
         }
 
     def _mask_if_secret(self, key: str, value: Any) -> Any:
@@ -204,10 +666,7 @@ class YamlConfigLoader:
         if value is None:
             return None
 
-        key_lower = key.lower()
-        sensitive_keywords = ("secret", "api_key", "password", "token", "credential")
-
-        if any(keyword in key_lower for keyword in sensitive_keywords):
+        if _SECRET_RE.search(key):
             s = str(value)
             if len(s) <= 6:
                 return "***hidden***"
@@ -215,34 +674,68 @@ class YamlConfigLoader:
 
         return value
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute and invalidate the cached repr."""
+        super().__setattr__(name, value)
+        if name != "_repr_cache":
+            super().__setattr__("_repr_cache", None)
+
+    def __delattr__(self, name: str) -> None:
+        """Delete an attribute and invalidate the cached repr."""
+        super().__delattr__(name)
+        super().__setattr__("_repr_cache", None)
+
     def __repr__(self) -> str:
         """
         Pretty representation of the configuration.
 
+        Built on first use, then served from the cache until an attribute
+        of the instance is set or deleted. Instances holding a relative
+        pathlib.Path are rendered on every call, so the path follows the
+        working directory.
+
+        Returns:
+            Formatted string with configuration display
+        """
+        rendered = getattr(self, "_repr_cache", None)
+        if rendered is None:
+            rendered = self._build_repr()
+            # Only displayed values are resolved; config_path is shown as given
+            if not _has_relative_path(self.to_dict().values()):
+                super().__setattr__("_repr_cache", rendered)
+        return rendered
+
+    def _build_repr(self) -> str:
+        """
+        Render the configuration display.
+
         Returns:
             Formatted string with configuration display
         """
-        lines = ["\n"]
-        lines.append("╔════════════════════════════════════════════╗")
-        lines.append(f"║  {self.__class__.__name__.upper().center(40)}  ║")
-        lines.append("╚════════════════════════════════════════════╝")
-        lines.append("")
-        lines.append(f"▶ Config Path: {self.config_path}")
-        lines.append("")
+        lines = [
+            "\n",
+            "╔════════════════════════════════════════════╗",
+            f"║  {self.__class__.__name__.upper().center(40)}  ║",
+            "╚════════════════════════════════════════════╝",
+            "",
+            f"▶ Config Path: {self.config_path}",
+            "",
+        ]
+        append = lines.append  # bound once for the loop below
 
         config_dict = self.to_dict()
         if not config_dict:
-            lines.append("  (No configuration loaded)")
+            append("  (No configuration loaded)")
         else:
-            max_key_len = max(len(k) for k in config_dict.keys())
+            max_key_len = max(map(len, config_dict))
+            mask = self._mask_if_secret
 
-            for key in sorted(config_dict.keys()):
-                value = config_dict[key]
-                display_value = self._mask_if_secret(key, value)
+            for key, value in sorted(config_dict.items()):
+                display_value = mask(key, value)
 
                 # Handle paths
                 if isinstance(display_value, pathlib.Path):
-                    display_value = str(display_value.resolve())
+                    display_value = _display_path(display_value)
 
                 # Handle lists/dicts - show count
                 if isinstance(display_value, list):
@@ -250,9 +743,9 @@ class YamlConfigLoader:
                 elif isinstance(display_value, dict):
                     display_value = f"{{{len(display_value)} keys}}"
 
-                lines.append(f"  {key.ljust(max_key_len)} = {display_value!r}")
+                append(f"  {key.ljust(max_key_len)} = {display_value!r}")
 
-        lines.append("")
+        append("")
         return "\n".join(lines)
 
     def __str__(self) -> str:
@@ -240,3 +240,85 @@ def test_config_meta_multiple_groups():
     assert len(groups["DATABASE"]) == 2
     assert len(groups["API"]) == 2
     assert len(groups["REDIS"]) == 2
+
+
+def test_config_meta_grouped_items_shared_prefix():
+    """Test that keys sharing a leading substring still group by prefix."""
+
+    class PrefixConfig(ConfigBase):
+        API = "root"
+        APIX_URL = "other"
+        API_KEY = "key123"
+
+    groups = PrefixConfig._grouped_items()
+
+    assert list(groups) == ["API", "APIX"]
+    assert [k for k, _ in groups["API"]] == ["API", "API_KEY"]
+
+
+def test_config_meta_repr_cache_invalidation():
+    """Test that the cached repr is refreshed when an attribute changes."""
+
+    class MutableConfig(ConfigBase):
+        CACHE_VALUE = "before"
+
+    assert "before" in repr(MutableConfig)
+
+    MutableConfig.CACHE_VALUE = "after"
+    repr_str = repr(MutableConfig)
+    assert "after" in repr_str
+    assert "before" not in repr_str
+
+    MutableConfig.CACHE_EXTRA = 1
+    assert "CACHE_EXTRA" in repr(MutableConfig)
+
+    del MutableConfig.CACHE_EXTRA
+    assert "CACHE_EXTRA" not in repr(MutableConfig)
+
+
+def test_config_meta_to_dict_tracks_class_changes():
+    """Test that keys added or removed after class creation are reflected."""
+
+    class DynamicConfig(ConfigBase):
+        DYNAMIC_A = 1
+        _HIDDEN_UPPER = "excluded"
+
+    assert DynamicConfig.to_dict() == {"DYNAMIC_A": 1}
+
+    DynamicConfig.DYNAMIC_B = 2
+    assert DynamicConfig.to_dict() == {"DYNAMIC_A": 1, "DYNAMIC_B": 2}
+
+    del DynamicConfig.DYNAMIC_A
+    assert DynamicConfig.to_dict() == {"DYNAMIC_B": 2}
+
+    DynamicConfig.DYNAMIC_B = 3
+    assert DynamicConfig.to_dict() == {"DYNAMIC_B": 3}
+
+
+def test_config_meta_to_dict_returns_copy():
+    """Test that mutating the to_dict result does not affect the class."""
+
+    class CopyConfig(ConfigBase):
+        COPY_VALUE = 1
+
+    CopyConfig.to_dict()["COPY_VALUE"] = 2
+    assert CopyConfig.to_dict() == {"COPY_VALUE": 1}
+    assert CopyConfig.COPY_VALUE == 1
+
+
+def test_config_meta_repr_relative_path_follows_cwd(tmp_path, monkeypatch):
+    """Test that relative paths are re-resolved against the current directory."""
+
+    class RelativeConfig(ConfigBase):
+        DATA_DIR = pathlib.Path("data")
+
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+
+    monkeypatch.chdir(first)
+    assert str(first.resolve() / "data") in repr(RelativeConfig)
+
+    monkeypatch.chdir(second)
+    assert str(second.resolve() / "data") in repr(RelativeConfig)
@@ -3,33 +3,27 @@ Tests for EnvConfigLoader
 """
 
 import pytest
-import os
 import pathlib
 from configplusplus import EnvConfigLoader, env
 
 
 @pytest.fixture
-def setup_env_vars():
+def setup_env_vars(monkeypatch):
     """Setup test environment variables."""
-    os.environ["TEST_STRING"] = "hello"
-    os.environ["TEST_INT"] = "42"
-    os.environ["TEST_BOOL_TRUE"] = "true"
-    os.environ["TEST_BOOL_FALSE"] = "false"
-    os.environ["TEST_PATH"] = "/tmp/test"
-    os.environ["SECRET_TEST_KEY"] = "secret123456"
+    for key, value in {
+        "TEST_STRING": "hello",
+        "TEST_INT": "42",
+        "TEST_BOOL_TRUE": "true",
+        "TEST_BOOL_FALSE": "false",
+        "TEST_PATH": "/tmp/test",
+        "SECRET_TEST_KEY": "secret123456",
+    }.items():
+        monkeypatch.setenv(key, value)
 
     yield
 
-    # Cleanup
-    for key in [
-        "TEST_STRING",
-        "TEST_INT",
-        "TEST_BOOL_TRUE",
-        "TEST_BOOL_FALSE",
-        "TEST_PATH",
-        "SECRET_TEST_KEY",
-    ]:
-        os.environ.pop(key, None)
+    # monkeypatch restores the environment; drop casts memoized meanwhile
+    env.cache_clear()
 
 
 def test_env_string_casting(setup_env_vars):
@@ -208,7 +202,7 @@ def test_env_config_loader_validation(setup_env_vars):
         ValidatedConfig.validate()
 
 
-def test_bool_casting_variations():
+def test_bool_casting_variations(monkeypatch):
     """Test various boolean string representations."""
     test_cases = {
         "false": False,
@@ -226,8 +220,61 @@ def test_bool_casting_variations():
     }
 
     for string_val, expected in test_cases.items():
-        os.environ["BOOL_TEST"] = string_val
+        monkeypatch.setenv("BOOL_TEST", string_val)
         result = env("BOOL_TEST", cast=bool)
         assert result is expected, f"Failed for '{string_val}'"
 
-    os.environ.pop("BOOL_TEST", None)
+
+def test_bool_casting_non_string_default():
+    """Test that non-string defaults are cast with bool()."""
+    assert env("MISSING_BOOL_VAR", cast=bool, default=False) is False
+    assert env("MISSING_BOOL_VAR", cast=bool, default=1) is True
+
+
+def test_env_default_is_cast():
+    """Test that a raw default goes through the cast like an env value."""
+    value = env("MISSING_PATH_VAR", cast=pathlib.Path, default="./data")
+    assert value == pathlib.Path("./data")
+    assert isinstance(value, pathlib.Path)
+
+    assert env("MISSING_INT_VAR", cast=int, default="8000") == 8000
+
+
+def test_env_cast_cache_follows_environment(monkeypatch):
+    """Test that memoized casts never hide a changed environment value."""
+    monkeypatch.setenv("CACHED_PATH", "/tmp/one")
+    assert env("CACHED_PATH", cast=pathlib.Path) == pathlib.Path("/tmp/one")
+
+    monkeypatch.setenv("CACHED_PATH", "/tmp/two")
+    assert env("CACHED_PATH", cast=pathlib.Path) == pathlib.Path("/tmp/two")
+
+    env.cache_clear()
+    assert env("CACHED_PATH", cast=pathlib.Path) == pathlib.Path("/tmp/two")
+
+
+def test_bool_casting_whitespace_and_case(monkeypatch):
+    """Test that bool casting ignores surrounding whitespace and case."""
+    for string_val in (" false ", "\tNO\n", "  0", " "):
+        monkeypatch.setenv("BOOL_TEST", string_val)
+        assert env("BOOL_TEST", cast=bool) is False, f"Failed for {string_val!r}"
+
+    monkeypatch.setenv("BOOL_TEST", " Yes ")
+    assert env("BOOL_TEST", cast=bool) is True
+
+
+def test_env_config_loader_has_inherited_keys(setup_env_vars):
+    """Test has/get with inherited and late-added keys."""
+
+    class ParentConfig(EnvConfigLoader):
+        TEST_STRING = env("TEST_STRING")
+
+    class ChildConfig(ParentConfig):
+        TEST_INT = env("TEST_INT", cast=int)
+
+    assert ChildConfig.has("test_string") is True
+    assert ChildConfig.get("TEST_STRING") == "hello"
+    assert ChildConfig.has("_KEYS") is False
+
+    ParentConfig.TEST_LATE = "late"
+    assert ChildConfig.has("TEST_LATE") is True
+    assert ChildConfig.get("TEST_LATE") == "late"
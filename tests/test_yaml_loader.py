@@ -3,8 +3,10 @@ Tests for YamlConfigLoader
 """
 
 import pytest
+import os
 import pathlib
 import tempfile
+import threading
 import yaml
 from configplusplus import YamlConfigLoader
 
@@ -111,6 +113,20 @@ def test_yaml_config_loader_has_method(sample_yaml_file):
     assert config.has("missing.key") is False
 
 
+def test_yaml_config_loader_get_through_non_mapping(tmp_path):
+    """Test get/has on paths crossing scalars, lists and null values."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("a:\n  b: null\n  c: 1\nitems: [x, y]\n")
+    config = YamlConfigLoader(config_file)
+
+    assert config.get("a.b", default="fallback") is None
+    assert config.has("a.b") is True
+    assert config.get("a.c.d", default="fallback") == "fallback"
+    assert config.has("a.c.d") is False
+    assert config.get("items.0", default="fallback") == "fallback"
+    assert config.has("items.0") is False
+
+
 def test_yaml_config_loader_to_dict(sample_yaml_file):
     """Test to_dict method."""
     config = SimpleYamlConfig(sample_yaml_file)
@@ -247,3 +263,359 @@ def test_yaml_config_loader_str_method(sample_yaml_file):
 
     # str and repr should be the same
     assert str_output == repr_output
+
+
+def test_yaml_config_loader_cache_sidecar(tmp_path, monkeypatch):
+    """Test that cache=True writes and reuses a pickle sidecar."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("database:\n  host: localhost\n  port: 5432\n")
+    cache_file = tmp_path / "config.yaml.cpp-cache"
+
+    class CachedConfig(YamlConfigLoader):
+        def __post_init__(self) -> None:
+            self.database_host = self._raw_config["database"]["host"]
+
+    config = CachedConfig(config_file, cache=True)
+    assert config.database_host == "localhost"
+    assert cache_file.exists()
+
+    # Forget the in-process copy and forbid parsing: only the sidecar remains
+    YamlConfigLoader.clear_cache()
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("YAML file parsed despite a valid sidecar")
+
+    monkeypatch.setattr(yaml, "load", fail_parse)
+    cached = CachedConfig(config_file, cache=True)
+    assert cached._raw_config == config._raw_config
+
+
+def test_yaml_config_loader_cache_invalidation(tmp_path):
+    """Test that the sidecar is ignored once the YAML file changes."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("database:\n  host: localhost\n")
+
+    YamlConfigLoader(config_file, cache=True)
+    config_file.write_text("database:\n  host: db.example.com\n")
+
+    config = YamlConfigLoader(config_file, cache=True)
+    assert config.get("database.host") == "db.example.com"
+
+
+def test_yaml_config_loader_cache_disabled_by_default(sample_yaml_file):
+    """Test that no sidecar is written unless cache=True."""
+    SimpleYamlConfig(sample_yaml_file)
+
+    assert not pathlib.Path(sample_yaml_file + ".cpp-cache").exists()
+
+
+def test_yaml_config_loader_sections(sample_yaml_file):
+    """Test that SECTIONS restricts which top-level keys are constructed."""
+
+    class SectionConfig(YamlConfigLoader):
+        SECTIONS = ("database", "settings")
+
+    config = SectionConfig(sample_yaml_file)
+
+    assert set(config._raw_config) == {"database", "settings"}
+    assert config.get("database.host") == "localhost"
+    assert config.get("api.endpoint", default="skipped") == "skipped"
+
+
+def test_yaml_config_loader_sections_with_anchors(tmp_path):
+    """Test that aliases into skipped sections still resolve."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "defaults: &defaults\n  timeout: 30\n"
+        "api:\n  <<: *defaults\n  endpoint: https://api.example.com\n"
+    )
+
+    class AnchorConfig(YamlConfigLoader):
+        SECTIONS = ("api",)
+
+    config = AnchorConfig(config_file)
+
+    assert config._raw_config == {
+        "api": {"timeout": 30, "endpoint": "https://api.example.com"}
+    }
+
+
+def test_yaml_config_loader_json_file(tmp_path):
+    """Test that .json files are loaded through the json decoder."""
+    config_file = tmp_path / "config.json"
+    config_file.write_text(
+        '{"database": {"host": "localhost", "port": 5432}, "api": {"timeout": 30}}'
+    )
+
+    class JsonConfig(YamlConfigLoader):
+        SECTIONS = ("database",)
+        FAST_JSON = True
+
+        def __post_init__(self) -> None:
+            self.database_host = self._raw_config["database"]["host"]
+
+    config = JsonConfig(config_file)
+
+    assert config.database_host == "localhost"
+    assert config._raw_config == {"database": {"host": "localhost", "port": 5432}}
+
+
+def test_yaml_config_loader_json_file_yaml_fallback(tmp_path):
+    """Test that a .json file which is not strict JSON falls back to YAML."""
+    config_file = tmp_path / "config.json"
+    config_file.write_text("{database: {host: localhost}}")
+
+    class JsonConfig(YamlConfigLoader):
+        FAST_JSON = True
+
+    config = JsonConfig(config_file)
+
+    assert config.get("database.host") == "localhost"
+
+    # Undecodable bytes are reported by the YAML parser
+    config_file.write_bytes(b'{"host": "\xff\xfe\xfa"}')
+    with pytest.raises(yaml.YAMLError):
+        JsonConfig(config_file)
+
+
+def test_yaml_config_loader_json_numbers(tmp_path):
+    """Test that FAST_JSON is opt-in since JSON and YAML 1.1 numbers differ."""
+    config_file = tmp_path / "config.json"
+    config_file.write_text('{"x": 1e3, "y": 1.5e10}')
+
+    class JsonConfig(YamlConfigLoader):
+        FAST_JSON = True
+
+    assert YamlConfigLoader(config_file)._raw_config == {"x": "1e3", "y": "1.5e10"}
+    assert JsonConfig(config_file)._raw_config == {"x": 1000.0, "y": 1.5e10}
+
+    # Cached results are kept apart per decoder
+    assert YamlConfigLoader(config_file, cache=True).get("x") == "1e3"
+    assert JsonConfig(config_file, cache=True).get("x") == 1000.0
+
+
+def test_yaml_config_loader_parse_cache_isolation(tmp_path):
+    """Test that reused parse results are not shared between instances."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("database:\n  host: localhost\n")
+
+    first = YamlConfigLoader(config_file, cache=True)
+    first._raw_config["database"]["host"] = "mutated"
+
+    second = YamlConfigLoader(config_file, cache=True)
+    assert second.get("database.host") == "localhost"
+    assert second._raw_config is not first._raw_config
+
+
+def test_yaml_config_loader_clear_cache(tmp_path):
+    """Test that clear_cache() empties the in-process parse cache."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("database:\n  host: localhost\n")
+
+    YamlConfigLoader(config_file, cache=True)
+    assert YamlConfigLoader._PARSE_CACHE
+
+    YamlConfigLoader.clear_cache()
+    assert not YamlConfigLoader._PARSE_CACHE
+
+    config = YamlConfigLoader(config_file, cache=True)
+    assert config.get("database.host") == "localhost"
+
+
+def test_yaml_config_loader_parse_cache_opt_in(tmp_path):
+    """Test that without cache=True every load reads the file again."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("host: aaaa\n")
+    stat = config_file.stat()
+    YamlConfigLoader(config_file)
+
+    # Same size and mtime, as after rsync -t or cp -p
+    config_file.write_text("host: bbbb\n")
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert YamlConfigLoader(config_file).get("host") == "bbbb"
+
+
+def test_yaml_config_loader_parse_cache_per_loader(tmp_path):
+    """Test that a subclass overriding _load_yaml gets its own parse."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("host: ${HOST}\n")
+
+    class ExpandingConfig(YamlConfigLoader):
+        def _load_yaml(self):
+            return {"host": "real"}
+
+    assert YamlConfigLoader(config_file, cache=True).get("host") == "${HOST}"
+    assert ExpandingConfig(config_file, cache=True).get("host") == "real"
+    assert YamlConfigLoader(config_file, cache=True).get("host") == "${HOST}"
+
+
+def test_yaml_config_loader_cache_list_sections(tmp_path):
+    """Test that SECTIONS given as a list works with the cache."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("database:\n  host: localhost\napi:\n  timeout: 30\n")
+
+    class ListSectionConfig(YamlConfigLoader):
+        SECTIONS = ["database"]
+
+    for _ in range(2):
+        config = ListSectionConfig(config_file, cache=True)
+        assert set(config._raw_config) == {"database"}
+
+
+def test_yaml_config_loader_repr_cache_invalidation(sample_yaml_file):
+    """Test that the cached repr is refreshed when an attribute changes."""
+    config = SimpleYamlConfig(sample_yaml_file)
+    assert "localhost" in repr(config)
+
+    config.database_host = "db.example.com"
+    repr_str = repr(config)
+    assert "db.example.com" in repr_str
+    assert "localhost" not in repr_str
+
+    del config.database_host
+    assert "database_host" not in repr(config)
+
+    config.database_host = ["a", "b"]
+    assert "[2 items]" in repr(config)
+
+
+def test_yaml_config_loader_sections_shared_anchor(tmp_path):
+    """Test aliases between selected sections and root merge keys."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "database: &db {host: localhost}\n" "skipped: [1, 2, 3]\n" "replica: *db\n"
+    )
+
+    class ReplicaConfig(YamlConfigLoader):
+        SECTIONS = ("database", "replica")
+
+    config = ReplicaConfig(config_file)
+    assert config._raw_config == {
+        "database": {"host": "localhost"},
+        "replica": {"host": "localhost"},
+    }
+
+    merged_file = tmp_path / "merged.yaml"
+    merged_file.write_text("<<: {database: {host: merged}}\nskipped: 1\n")
+
+    class MergedConfig(YamlConfigLoader):
+        SECTIONS = ("database",)
+
+    assert MergedConfig(merged_file).get("database.host") == "merged"
+
+
+def test_yaml_config_loader_logger_shared_per_class(sample_yaml_file):
+    """Test that instances of a class share one bound logger."""
+    first = SimpleYamlConfig(sample_yaml_file)
+    second = SimpleYamlConfig(sample_yaml_file)
+
+    assert first.logger is second.logger
+    assert "logger" not in first.__dict__
+
+
+def test_yaml_config_loader_repr_relative_path_follows_cwd(
+    sample_yaml_file, tmp_path, monkeypatch
+):
+    """Test that relative paths are re-resolved against the current directory."""
+
+    class RelativeConfig(YamlConfigLoader):
+        def __post_init__(self) -> None:
+            self.data_dir = pathlib.Path("data")
+
+    config = RelativeConfig(sample_yaml_file)
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+
+    monkeypatch.chdir(first)
+    assert str(first.resolve() / "data") in repr(config)
+
+    monkeypatch.chdir(second)
+    assert str(second.resolve() / "data") in repr(config)
+
+
+def test_yaml_config_loader_sections_duplicate_anchor(tmp_path):
+    """Test that SECTIONS rejects duplicate anchors like a full load."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("a: &x 1\nb: &x 2\nc: *x\n")
+
+    class SectionConfig(YamlConfigLoader):
+        SECTIONS = ("a", "b", "c")
+
+    with pytest.raises(yaml.YAMLError, match="duplicate anchor"):
+        SectionConfig(config_file)
+
+
+def test_yaml_config_loader_sections_tagged_root(tmp_path):
+    """Test that SECTIONS honours an explicit root tag like a full load."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("--- !foo\na: 1\n")
+
+    class SectionConfig(YamlConfigLoader):
+        SECTIONS = ("a",)
+
+    with pytest.raises(yaml.YAMLError):
+        SectionConfig(config_file)
+
+    config_file.write_text("--- !!map\na: 1\nb: 2\n")
+    assert SectionConfig(config_file)._raw_config == {"a": 1}
+
+
+def test_yaml_config_loader_logger_assignable(sample_yaml_file):
+    """Test that a subclass can still assign its own logger."""
+    custom = object()
+
+    class LoggingConfig(YamlConfigLoader):
+        def __post_init__(self) -> None:
+            self.logger = custom
+
+    config = LoggingConfig(sample_yaml_file)
+    assert config.logger is custom
+    assert "logger" not in config.to_dict()
+    assert SimpleYamlConfig(sample_yaml_file).logger is not custom
+
+
+def test_yaml_config_loader_cache_unpicklable_data(tmp_path):
+    """Test that unpicklable data is returned uncached, leaving no temp files."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("database:\n  host: localhost\n")
+
+    class LockConfig(YamlConfigLoader):
+        def _load_yaml(self):
+            return {"lock": threading.Lock()}
+
+    config = LockConfig(config_file, cache=True)
+    assert "lock" in config._raw_config
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["config.yaml"]
+
+
+def test_yaml_config_loader_repr_cached_with_relative_config_path(
+    tmp_path, monkeypatch
+):
+    """Test that a relative config_path does not disable the repr cache."""
+    (tmp_path / "config.yaml").write_text("database:\n  host: localhost\n")
+    monkeypatch.chdir(tmp_path)
+
+    config = YamlConfigLoader("config.yaml")
+    rendered = repr(config)
+
+    assert config._repr_cache is rendered
+
+
+def test_yaml_config_loader_sections_recursive_anchor(tmp_path):
+    """Test that a selected section aliasing itself builds like a full load."""
+    config_file = tmp_path / "config.yaml"
+
+    class SectionConfig(YamlConfigLoader):
+        SECTIONS = ("a", "b")
+
+    # Event-stream path, then the composer fallback (root merge key)
+    for prefix in ("", "<<: {m: 1}\n"):
+        config_file.write_text(prefix + "a: &r {self: *r}\nb: *r\nc: 1\n")
+        config = SectionConfig(config_file)
+
+        section = config._raw_config["a"]
+        assert section["self"] is section
+        assert config._raw_config["b"] is section